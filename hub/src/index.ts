@@ -2,7 +2,7 @@ import * as path from 'path'
 import { fileURLToPath } from 'url'
 import { makeHttpServer } from './server/http.js'
 import { getConfig, validateConfigSchema, HttpsOption } from './server/config.js'
-import { logger } from './server/utils.js'
+import { logger, disableNagle } from './server/utils.js'
 import * as http from 'http'
 import * as tlsServer from './server/tlsServer.js'
 import * as acme from './server/acmeClient.js'
@@ -28,6 +28,8 @@ function logHttpsListen() {
 
 if (conf.enableHttps === HttpsOption.acme) {
   // Start Express app server using ACME with greenlock-express middleware.
+  // greenlock creates and listens on its own servers, so these connections
+  // keep Node's default Nagle setting (disableNagle is not applied).
   logger.warn('Setting up https server with ACME')
   const server = acme.createGlx(app, conf.acmeConfig)
   void server.listen(conf.port, conf.httpsPort, () => logHttpListen(), () => logHttpsListen())
@@ -35,11 +37,11 @@ if (conf.enableHttps === HttpsOption.acme) {
   logger.warn('Setting up https server with provided cert files')
   // Start Express app server with Node.js `https` and `http` modules.
   tlsServer.createHttpsServer(app, conf.tlsCertConfig).listen(conf.httpsPort, () => logHttpsListen())
-  http.createServer(app).listen(conf.port, () => logHttpListen())
+  disableNagle(http.createServer(app)).listen(conf.port, () => logHttpListen())
 } else {
   logger.warn('Setting up an http server (https is not configured)')
   // Start Express app server with only `http`.
-  http.createServer(app).listen(conf.port, () => logHttpListen())
+  disableNagle(http.createServer(app)).listen(conf.port, () => logHttpListen())
 }
 
 driver.ensureInitialized().catch(error => {
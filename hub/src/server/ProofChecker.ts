@@ -1,14 +1,26 @@
 import { validateProofs, verifyProfileToken } from 'blockstack'
 import cheerio from 'cheerio'
-import { logger } from './utils.js'
+import LRUCache from 'lru-cache'
+import { logger, getKeepAliveAgent } from './utils.js'
 import fetch from 'node-fetch'
 
 import { NotEnoughProofError } from './errors.js'
 import { ProofCheckerConfigInterface } from './config.js'
 import { getTokenPayload } from './authentication.js'
 
+// Addresses whose profile recently passed the proof check, so repeated writes
+// don't re-fetch the profile and every social proof page.
+const VALID_PROOFS_CACHE_SIZE = 10000
+const DEFAULT_VALID_PROOFS_CACHE_TTL_SECONDS = 300
+
 export class ProofChecker {
   proofsRequired: number
+  validProofsCacheEnabled: boolean
+  validProofsCache: LRUCache<string, boolean>
+  // Bumped each time an address's profile is rewritten, so a check that was
+  // already fetching the old profile doesn't cache its stale result.
+  profileGenerations: LRUCache<string, number>
+  profileGenerationCount: number
 
   constructor(proofsConfig?: ProofCheckerConfigInterface) {
     if (!proofsConfig) {
@@ -16,13 +28,32 @@ export class ProofChecker {
     } else {
       this.proofsRequired = proofsConfig.proofsRequired
     }
+    const ttlSeconds = (proofsConfig && Number.isFinite(proofsConfig.validProofsCacheTTLSeconds))
+      ? proofsConfig.validProofsCacheTTLSeconds : DEFAULT_VALID_PROOFS_CACHE_TTL_SECONDS
+    // lru-cache treats a ttl of 0 as "never expire", so a zero TTL disables caching instead.
+    this.validProofsCacheEnabled = ttlSeconds > 0
+    this.validProofsCache = new LRUCache<string, boolean>({
+      max: VALID_PROOFS_CACHE_SIZE,
+      ttl: this.validProofsCacheEnabled ? ttlSeconds * 1000 : undefined
+    })
+    this.profileGenerations = new LRUCache<string, number>({ max: VALID_PROOFS_CACHE_SIZE })
+    this.profileGenerationCount = 0
+  }
+
+  /**
+   * Drops any cached proof check result for `address`. Called once a write or
+   * delete of the address's profile.json has completed.
+   */
+  invalidate(address: string) {
+    this.profileGenerations.set(address, ++this.profileGenerationCount)
+    this.validProofsCache.delete(address)
   }
 
   async fetchProfile(address: string, readURL: string) {
     const filename = `${address}/profile.json`
     const url = `${readURL}${filename}`
 
-    const result = await fetch(url)
+    const result = await fetch(url, { agent: getKeepAliveAgent })
     const json = await result.json()
     const token = json[0].token
     const verified = verifyProfileToken(token, address)
@@ -39,6 +70,14 @@ export class ProofChecker {
       return true
     }
 
+    // A profile write is checked against the profile it is replacing, so that
+    // result is never cached. HubServer calls invalidate() once the write lands.
+    const isProfileWrite = filename === 'profile.json'
+    if (!isProfileWrite && this.validProofsCache.has(address)) {
+      return true
+    }
+    const profileGeneration = this.profileGenerations.get(address)
+
     let validProofs
     try {
       const profile = await this.fetchProfile(address, readURL)
@@ -50,6 +89,10 @@ export class ProofChecker {
     }
 
     if (this.validEnough(validProofs)) {
+      if (this.validProofsCacheEnabled && !isProfileWrite &&
+          this.profileGenerations.get(address) === profileGeneration) {
+        this.validProofsCache.set(address, true)
+      }
       return true
     } else {
       throw new NotEnoughProofError('Not enough social proofs for gaia hub writes')
@@ -3,6 +3,7 @@ import * as ecpair from 'ecpair'
 import * as ecc from 'tiny-secp256k1'
 import * as crypto from 'crypto'
 import { decodeToken, TokenSigner, TokenVerifier } from 'jsontokens'
+import LRUCache from 'lru-cache'
 import { ecPairToHexString, ecPairToAddress } from 'blockstack'
 import { ValidationError, AuthTokenTimestampValidationError } from './errors.js'
 import { logger } from './utils.js'
@@ -16,6 +17,19 @@ function pubkeyHexToECPair (pubkeyHex: string) {
   return ECPair.fromPublicKey(pkBuff)
 }
 
+// Deriving an address decodes the EC point and hashes it; the result only
+// depends on the key, and the same few keys sign most requests.
+const pubkeyAddressCache = new LRUCache<string, string>({ max: 10000 })
+
+function pubkeyHexToAddress (pubkeyHex: string) {
+  let address = pubkeyAddressCache.get(pubkeyHex)
+  if (address === undefined) {
+    address = ecPairToAddress(pubkeyHexToECPair(pubkeyHex))
+    pubkeyAddressCache.set(pubkeyHex, address)
+  }
+  return address
+}
+
 export interface AuthScopeEntry {
   scope: string
   domain: string
@@ -218,13 +232,13 @@ export class V1Authentication implements AuthenticationInterface {
     }
 
     // the bearer of the association token must have authorized the bearer
-    const childAddress = ecPairToAddress(pubkeyHexToECPair(childPublicKey as string))
+    const childAddress = pubkeyHexToAddress(childPublicKey as string)
     if (childAddress !== bearerAddress) {
       throw new ValidationError(
         `Association token child key ${childPublicKey} does not match ${bearerAddress}`)
     }
 
-    const signerAddress = ecPairToAddress(pubkeyHexToECPair(publicKey))
+    const signerAddress = pubkeyHexToAddress(publicKey)
     return signerAddress
 
   }
@@ -315,7 +329,7 @@ export class V1Authentication implements AuthenticationInterface {
       }
     }
 
-    const issuerAddress = ecPairToAddress(pubkeyHexToECPair(publicKey))
+    const issuerAddress = pubkeyHexToAddress(publicKey)
 
     if (issuerAddress !== address) {
       throw new ValidationError('Address not allowed to write on this path')
@@ -438,7 +452,9 @@ export class LegacyAuthentication implements AuthenticationInterface {
         return address
       }
     }
-    logger.debug(`Failed to validate with challenge text: ${JSON.stringify(challengeTexts)}`)
+    if (logger.isDebugEnabled()) {
+      logger.debug(`Failed to validate with challenge text: ${JSON.stringify(challengeTexts)}`)
+    }
     throw new ValidationError('Invalid signature or expired authentication token.')
   }
 }
@@ -459,6 +475,19 @@ export function getLegacyChallengeTexts(myURL: string = DEFAULT_STORAGE_URL): Ar
     [header, year, myURL, myChallenge]))
 }
 
+// The challenge texts only depend on the server name, which is fixed for the
+// life of the process, so build them once instead of on every request.
+const challengeTextsByServerName = new Map<string, string[]>()
+
+function getAllChallengeTexts(serverName: string): string[] {
+  let challengeTexts = challengeTextsByServerName.get(serverName)
+  if (!challengeTexts) {
+    challengeTexts = [getChallengeText(serverName), ...getLegacyChallengeTexts(serverName)]
+    challengeTextsByServerName.set(serverName, challengeTexts)
+  }
+  return challengeTexts
+}
+
 export function parseAuthHeader(authHeader: string): AuthenticationInterface {
   if (!authHeader || !authHeader.toLowerCase().startsWith('bearer')) {
     throw new ValidationError('Failed to parse authentication header.')
@@ -500,9 +529,7 @@ export function validateAuthorizationHeader(authHeader: string, serverName: stri
     throw new ValidationError('Failed to parse authentication header.')
   }
 
-  const challengeTexts = []
-  challengeTexts.push(getChallengeText(serverName))
-  getLegacyChallengeTexts(serverName).forEach(challengeText => challengeTexts.push(challengeText))
+  const challengeTexts = getAllChallengeTexts(serverName)
 
   return authObject.isAuthenticationValid(address, challengeTexts, { validHubUrls, requireCorrectHubUrl, oldestValidTokenTimestamp })
 }
@@ -44,6 +44,12 @@ class LoggingConfig implements LoggingConfigInterface {
 
 export interface ProofCheckerConfigInterface {
   proofsRequired?: number;
+  /**
+   * How long a passing proof check is reused for an address before its profile
+   * and social proofs are fetched again. Proofs removed from a profile hosted
+   * elsewhere stay accepted for up to this long. Set to 0 to disable the cache.
+   */
+  validProofsCacheTTLSeconds?: number;
 }
 
 // ProofCheckerConfig defaults
@@ -52,6 +58,10 @@ class ProofCheckerConfig implements ProofCheckerConfigInterface {
    * @TJS-type integer
    */
   proofsRequired?= 0
+  /**
+   * @TJS-type integer
+   */
+  validProofsCacheTTLSeconds?= 300
 }
 
 export interface AcmeConfigInterface {
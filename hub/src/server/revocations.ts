@@ -1,7 +1,7 @@
 import LRUCache from 'lru-cache'
 import { DriverModel } from './driverModel.js'
 import fetch, { Response } from 'node-fetch'
-import { logger } from './utils.js'
+import { logger, getKeepAliveAgent } from './utils.js'
 import { Readable } from 'stream'
 import * as errors from './errors.js'
 
@@ -56,6 +56,7 @@ export class AuthTimestampCache {
       const authNumberFileUrl = `${this.readUrlPrefix}${authTimestampDir}/${AUTH_TIMESTAMP_FILE_NAME}`
       fetchResponse = await fetch(authNumberFileUrl, {
         redirect: 'manual',
+        agent: getKeepAliveAgent,
         headers: {
           'Cache-Control': 'no-cache'
         }
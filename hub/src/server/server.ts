@@ -13,7 +13,7 @@ import { logger, generateUniqueID, bytesToMegabytes, megabytesToBytes, monitorSt
 export class HubServer {
   driver: DriverModel
   proofChecker: ProofChecker
-  whitelist?: Array<string>
+  whitelist?: Set<string>
   serverName: string
   readURL?: string
   requireCorrectHubUrl: boolean
@@ -27,7 +27,9 @@ export class HubServer {
     this.driver = driver
     this.proofChecker = proofChecker
     this.config = config
-    this.whitelist = config.whitelist
+    // Hubs may whitelist many addresses; keep them in a Set so each request's
+    // membership check doesn't scan the whole list.
+    this.whitelist = config.whitelist ? new Set(config.whitelist) : undefined
     this.serverName = config.serverName
     this.validHubUrls = config.validHubUrls
     this.readURL = config.readURL
@@ -52,7 +54,7 @@ export class HubServer {
                                                        this.validHubUrls,
                                                        oldestValidTokenTimestamp)
 
-    if (this.whitelist && !(this.whitelist.includes(signingAddress))) {
+    if (this.whitelist && !(this.whitelist.has(signingAddress))) {
       throw new ValidationError(`Address ${signingAddress} not authorized for writes`)
     }
   }
@@ -157,21 +159,25 @@ export class HubServer {
 
     await this.proofChecker.checkProofs(address, path, this.getReadURLPrefix())
 
-    if (isArchivalRestricted) {
-      // if archival restricted then just rename the canonical file to the historical file
-      const historicalPath = this.getHistoricalFileName(path)
-      const renameCommand: PerformRenameArgs = {
-        path: path,
-        storageTopLevel: address,
-        newPath: historicalPath
-      }
-      await this.driver.performRename(renameCommand)
-    } else {
-      const deleteCommand: PerformDeleteArgs = {
-        storageTopLevel: address,
-        path
+    try {
+      if (isArchivalRestricted) {
+        // if archival restricted then just rename the canonical file to the historical file
+        const historicalPath = this.getHistoricalFileName(path)
+        const renameCommand: PerformRenameArgs = {
+          path: path,
+          storageTopLevel: address,
+          newPath: historicalPath
+        }
+        await this.driver.performRename(renameCommand)
+      } else {
+        const deleteCommand: PerformDeleteArgs = {
+          storageTopLevel: address,
+          path
+        }
+        await this.driver.performDelete(deleteCommand)
       }
-      await this.driver.performDelete(deleteCommand)
+    } finally {
+      this.invalidateProofsOnProfileChange(address, path)
     }
   }
 
@@ -233,41 +239,13 @@ export class HubServer {
     if (ifNoneMatchTag && ifNoneMatchTag !== '*') {
       throw new PreconditionFailedError('Misuse of the if-none-match header. Expected to be * on write requests.')
     }
-    // handle etag matching if not supported at the driver level
-    if (!this.driver.supportsETagMatching) {
-      // allow overwrites if tag is wildcard 
-      if (ifMatchTag && ifMatchTag !== '*') {
-        const currentETag = (await this.driver.performStat({
-          path: path,
-          storageTopLevel: address
-        })).etag
-
-        if (ifMatchTag !== currentETag) {
-          throw new PreconditionFailedError(
-            'The provided ETag does not match that of the resource on the server'
-          )
-        }
-      } else if (ifNoneMatchTag && ifNoneMatchTag === '*') {
-        // only proceed with writing file if the file does not already exist
-        const statResult = await this.driver.performStat({
-          path: path,
-          storageTopLevel: address
-        })
-
-        if (statResult.exists) {
-          throw new PreconditionFailedError('The entity you are trying to create already exists')
-        }
-      }
-    }
-
-
-    await this.proofChecker.checkProofs(address, path, this.getReadURLPrefix())
 
     const contentLengthHeader = requestHeaders['content-length'] as string
     const contentLengthBytes = parseInt(contentLengthHeader)
     const isLengthFinite = Number.isFinite(contentLengthBytes) && contentLengthBytes > 0
 
-    // If a valid content-length is specified check to immediately return error
+    // If a valid content-length is specified check to immediately return error,
+    // before paying for the storage and proof round-trips below
     if (isLengthFinite && contentLengthBytes > this.maxFileUploadSizeBytes) {
       const errMsg = `Max file upload size is ${this.maxFileUploadSizeMB} megabytes. ` +
         `Rejected Content-Length of ${bytesToMegabytes(contentLengthBytes, 4)} megabytes`
@@ -275,6 +253,16 @@ export class HubServer {
       throw new PayloadTooLargeError(errMsg)
     }
 
+    // The etag stat and the social proof check are independent round-trips,
+    // so start them together. The etag result is awaited first: clients rely on
+    // the 412 to decide whether to re-fetch the etag, and it shouldn't wait on
+    // the (possibly slow) proof fetches. The no-op catch keeps a proof failure
+    // from surfacing as an unhandled rejection if the etag check throws first.
+    const proofCheck = this.proofChecker.checkProofs(address, path, this.getReadURLPrefix())
+    proofCheck.catch(() => undefined)
+    await this.checkETagPreconditions(address, path, ifMatchTag, ifNoneMatchTag)
+    await proofCheck
+
     if (isArchivalRestricted) {
       const historicalPath = this.getHistoricalFileName(path)
       try {
@@ -331,7 +319,12 @@ export class HubServer {
       ifNoneMatch: ifNoneMatchTag
     }
 
-    const [writeResponse] = await Promise.all([this.driver.performWrite(writeCommand), pipelinePromise])
+    let writeResponse: WriteResult
+    try {
+      [writeResponse] = await Promise.all([this.driver.performWrite(writeCommand), pipelinePromise])
+    } finally {
+      this.invalidateProofsOnProfileChange(address, path)
+    }
     const readURL = writeResponse.publicURL
     const driverPrefix = this.driver.getReadURLPrefix()
     const readURLPrefix = this.getReadURLPrefix()
@@ -345,6 +338,44 @@ export class HubServer {
     return writeResponse
   }
 
+  // Cached proof checks were made against the old profile; drop them once a
+  // profile write or delete has reached storage (or failed part way).
+  invalidateProofsOnProfileChange(address: string, path: string) {
+    if (path === 'profile.json') {
+      this.proofChecker.invalidate(address)
+    }
+  }
+
+  // handle etag matching if not supported at the driver level
+  async checkETagPreconditions(address: string, path: string, ifMatchTag?: string, ifNoneMatchTag?: string) {
+    if (this.driver.supportsETagMatching) {
+      return
+    }
+    // allow overwrites if tag is wildcard 
+    if (ifMatchTag && ifMatchTag !== '*') {
+      const currentETag = (await this.driver.performStat({
+        path: path,
+        storageTopLevel: address
+      })).etag
+
+      if (ifMatchTag !== currentETag) {
+        throw new PreconditionFailedError(
+          'The provided ETag does not match that of the resource on the server'
+        )
+      }
+    } else if (ifNoneMatchTag && ifNoneMatchTag === '*') {
+      // only proceed with writing file if the file does not already exist
+      const statResult = await this.driver.performStat({
+        path: path,
+        storageTopLevel: address
+      })
+
+      if (statResult.exists) {
+        throw new PreconditionFailedError('The entity you are trying to create already exists')
+      }
+    }
+  }
+
   isArchivalRestricted(scopes: AuthScopeValues) {
     return scopes.writeArchivalPaths.length > 0 || scopes.writeArchivalPrefixes.length > 0
   }
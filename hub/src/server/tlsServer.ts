@@ -2,6 +2,7 @@ import { Application as ExpressApp } from 'express'
 import * as https from 'https'
 import * as fs from 'fs'
 import { TlsCertConfigInterface, TlsPfxCert, TlsPemCert } from './config'
+import { disableNagle } from './utils.js'
 
 function tryDecodeBase64(content: string): Buffer | false {
   try {
@@ -93,5 +94,5 @@ export function createHttpsServer(app: ExpressApp, tlsConfig: TlsCertConfigInter
     throw new Error('The `tlsCertConfig` must specify either a `keyFile` or a `pfxFile` property')
   }
   
-  return https.createServer(opts, app)
+  return disableNagle(https.createServer(opts, app))
 }
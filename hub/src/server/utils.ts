@@ -1,4 +1,7 @@
 import * as stream from 'stream'
+import * as http from 'http'
+import * as https from 'https'
+import * as net from 'net'
 import * as winston from 'winston'
 import { customAlphabet } from 'nanoid'
 
@@ -26,6 +29,28 @@ export const pipelineAsync = promisify(stream.pipeline)
 
 export const logger = winston.createLogger()
 
+const keepAliveHttpAgent = new http.Agent({ keepAlive: true })
+const keepAliveHttpsAgent = new https.Agent({ keepAlive: true })
+
+/**
+ * Returns a shared keep-alive agent for use as the node-fetch `agent` option, so
+ * repeated fetches against the read URL reuse connections instead of paying a
+ * TCP (and TLS) handshake on every request.
+ */
+export function getKeepAliveAgent(parsedURL: URL): http.Agent {
+  return parsedURL.protocol === 'http:' ? keepAliveHttpAgent : keepAliveHttpsAgent
+}
+
+/**
+ * Sets TCP_NODELAY on every accepted connection, so small JSON responses aren't
+ * held back by Nagle's algorithm. Done per socket rather than with the
+ * `noDelay` server option, which Node versions before 16.15 silently ignore.
+ */
+export function disableNagle<T extends net.Server>(server: T): T {
+  server.on('connection', (socket: net.Socket) => socket.setNoDelay(true))
+  return server
+}
+
 export function getDriverClass(driver: DriverName): DriverConstructor & DriverStatics {
   if (driver === 'aws') {
     return S3Driver
@@ -48,3 +48,73 @@ describe('proof checker unreachable read url', () => {
     }
   })
 })
+
+describe('proof checker caches valid proofs', () => {
+  test('should not re-fetch the profile for an address that recently passed', async () => {
+    expect.assertions(3)
+    const address = '1Nw25PemCRv24UQAcZdaj4uD11nkTCWRTE'
+    const readURL = 'https://gaia.blockstack.org/hub/'
+    const proofChecker = new ProofChecker({ proofsRequired: 1 })
+    expect(await proofChecker.checkProofs(address, 'somefile', readURL)).toBeTruthy()
+    expect(proofChecker.validProofsCache.has(address)).toBeTruthy()
+
+    // A cached address passes even when the read url is unreachable.
+    expect(await proofChecker.checkProofs(address, 'somefile', 'https://not.here.local/hub/')).toBeTruthy()
+  })
+
+  test('should not cache an address after a successful profile.json check', async () => {
+    expect.assertions(4)
+    const address = '1Nw25PemCRv24UQAcZdaj4uD11nkTCWRTE'
+    const readURL = 'https://gaia.blockstack.org/hub/'
+    const proofChecker = new ProofChecker({ proofsRequired: 1 })
+    expect(await proofChecker.checkProofs(address, 'somefile', readURL)).toBeTruthy()
+    expect(proofChecker.validProofsCache.has(address)).toBeTruthy()
+
+    // The profile being replaced still has valid proofs, but the new one
+    // must be checked again on the next write.
+    expect(await proofChecker.checkProofs(address, 'profile.json', readURL)).toBeTruthy()
+    expect(proofChecker.validProofsCache.has(address)).toBeFalsy()
+  })
+
+  test('should drop the cached address on invalidate', async () => {
+    expect.assertions(2)
+    const address = '1Nw25PemCRv24UQAcZdaj4uD11nkTCWRTE'
+    const proofChecker = new ProofChecker({ proofsRequired: 1 })
+    proofChecker.validProofsCache.set(address, true)
+    expect(proofChecker.validProofsCache.has(address)).toBeTruthy()
+    proofChecker.invalidate(address)
+    expect(proofChecker.validProofsCache.has(address)).toBeFalsy()
+  })
+
+  test('should not cache a check that was in flight when the profile changed', async () => {
+    expect.assertions(2)
+    const address = '1Nw25PemCRv24UQAcZdaj4uD11nkTCWRTE'
+    let resolveProfile: (profile: any) => void
+    class DeferredProfileChecker extends ProofChecker {
+      fetchProfile() {
+        return new Promise(resolve => { resolveProfile = resolve })
+      }
+      validEnough() {
+        return true
+      }
+    }
+    const proofChecker = new DeferredProfileChecker({ proofsRequired: 1 })
+    const check = proofChecker.checkProofs(address, 'somefile', 'https://not.here.local/hub/')
+
+    // The profile write lands while the old profile is still being checked.
+    proofChecker.invalidate(address)
+    resolveProfile({})
+
+    expect(await check).toBeTruthy()
+    expect(proofChecker.validProofsCache.has(address)).toBeFalsy()
+  })
+
+  test('should not cache anything with a zero ttl', async () => {
+    expect.assertions(2)
+    const address = '1Nw25PemCRv24UQAcZdaj4uD11nkTCWRTE'
+    const readURL = 'https://gaia.blockstack.org/hub/'
+    const proofChecker = new ProofChecker({ proofsRequired: 1, validProofsCacheTTLSeconds: 0 })
+    expect(await proofChecker.checkProofs(address, 'somefile', readURL)).toBeTruthy()
+    expect(proofChecker.validProofsCache.has(address)).toBeFalsy()
+  })
+})
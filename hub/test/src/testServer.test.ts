@@ -232,6 +232,147 @@ test('handle request', async () => {
   })
 })
 
+test('handle request invalidates cached proofs after a profile.json write or delete', async () => {
+  expect.assertions(3)
+  await usingMemoryDriver(async (mockDriver) => {
+    const proofChecker = new MockProofs()
+    const server = new HubServer(mockDriver, proofChecker,
+                                { whitelist: [testAddrs[0]], serverName: TEST_SERVER_NAME,
+                                  authTimestampCacheSize: TEST_AUTH_CACHE_SIZE, port: 0, driver: null })
+    server.authTimestampCache = new MockAuthTimestampCache()
+    const invalidateSpy = jest.spyOn(proofChecker, 'invalidate')
+    const challengeText = auth.getChallengeText(TEST_SERVER_NAME)
+    const authPart = auth.LegacyAuthentication.makeAuthPart(testPairs[0], challengeText)
+    const authorization = `bearer ${authPart}`
+
+    const s = new Readable()
+    s.push('hello world')
+    s.push(null)
+    await server.handleRequest(testAddrs[0], 'foo.txt',
+                               { 'content-length': 400, authorization }, s)
+    expect(invalidateSpy).not.toHaveBeenCalled()
+
+    const s2 = new Readable()
+    s2.push('[]')
+    s2.push(null)
+    await server.handleRequest(testAddrs[0], 'profile.json',
+                               { 'content-length': 400, authorization }, s2)
+    expect(invalidateSpy).toHaveBeenLastCalledWith(testAddrs[0])
+
+    await server.handleDelete(testAddrs[0], 'profile.json', { authorization })
+    expect(invalidateSpy).toHaveBeenCalledTimes(2)
+  })
+})
+
+test('handle request reports etag precondition failure before proof failure', async () => {
+  expect.assertions(2)
+  await usingMemoryDriver(async (mockDriver) => {
+    class FailingProofs extends ProofChecker {
+      checkProofs(): Promise<boolean> {
+        return Promise.reject(new errors.NotEnoughProofError('Not enough social proofs for gaia hub writes'))
+      }
+    }
+    const server = new HubServer(mockDriver, new FailingProofs(),
+                                { whitelist: [testAddrs[0]], serverName: TEST_SERVER_NAME,
+                                  authTimestampCacheSize: TEST_AUTH_CACHE_SIZE, port: 0, driver: null })
+    server.authTimestampCache = new MockAuthTimestampCache()
+    const challengeText = auth.getChallengeText(TEST_SERVER_NAME)
+    const authPart = auth.LegacyAuthentication.makeAuthPart(testPairs[0], challengeText)
+    const authorization = `bearer ${authPart}`
+
+    const s = new Readable()
+    s.push('hello world')
+    s.push(null)
+
+    try {
+      await server.handleRequest(testAddrs[0], 'foo.txt',
+                                 { 'content-type' : 'text/text',
+                                   'content-length': 400,
+                                   'if-match': 'not-the-current-etag',
+                                   authorization }, s)
+    } catch (error) {
+      expect(error).toBeInstanceOf(errors.PreconditionFailedError)
+      expect(mockDriver.lastWrite).toBeUndefined()
+    }
+  })
+})
+
+test('handle request overlaps the etag stat with the proof check', async () => {
+  expect.assertions(5)
+  await usingMemoryDriver(async (mockDriver) => {
+    let resolveProofs: (valid: boolean) => void
+    let proofsSettled = false
+    class DeferredProofs extends ProofChecker {
+      checkProofs(): Promise<boolean> {
+        return new Promise<boolean>(resolve => { resolveProofs = resolve })
+          .finally(() => { proofsSettled = true })
+      }
+    }
+    const server = new HubServer(mockDriver, new DeferredProofs(),
+                                { whitelist: [testAddrs[0]], serverName: TEST_SERVER_NAME,
+                                  authTimestampCacheSize: TEST_AUTH_CACHE_SIZE, port: 0, driver: null })
+    server.authTimestampCache = new MockAuthTimestampCache()
+    const statSpy = jest.spyOn(mockDriver, 'performStat')
+    const challengeText = auth.getChallengeText(TEST_SERVER_NAME)
+    const authPart = auth.LegacyAuthentication.makeAuthPart(testPairs[0], challengeText)
+    const authorization = `bearer ${authPart}`
+
+    const s = new Readable()
+    s.push('hello world')
+    s.push(null)
+
+    // The proof check never resolves on its own, so the 412 can only come back
+    // if the stat ran alongside it rather than after it.
+    try {
+      await server.handleRequest(testAddrs[0], 'foo.txt',
+                                 { 'content-length': 400,
+                                   'if-match': 'not-the-current-etag',
+                                   authorization }, s)
+    } catch (error) {
+      expect(error).toBeInstanceOf(errors.PreconditionFailedError)
+    }
+    expect(statSpy).toHaveBeenCalled()
+    expect(proofsSettled).toBeFalsy()
+    expect(resolveProofs).toBeDefined()
+    resolveProofs(true)
+    expect(mockDriver.lastWrite).toBeUndefined()
+  })
+})
+
+test('handle request rejects oversized content-length before etag and proof checks', async () => {
+  expect.assertions(3)
+  await usingMemoryDriver(async (mockDriver) => {
+    const proofChecker = new MockProofs()
+    const server = new HubServer(mockDriver, proofChecker,
+                                { whitelist: [testAddrs[0]], serverName: TEST_SERVER_NAME,
+                                  maxFileUploadSize: 1,
+                                  authTimestampCacheSize: TEST_AUTH_CACHE_SIZE, port: 0, driver: null })
+    server.authTimestampCache = new MockAuthTimestampCache()
+    const statSpy = jest.spyOn(mockDriver, 'performStat')
+    const proofSpy = jest.spyOn(proofChecker, 'checkProofs')
+      .mockRejectedValue(new errors.NotEnoughProofError('Not enough social proofs for gaia hub writes'))
+    const challengeText = auth.getChallengeText(TEST_SERVER_NAME)
+    const authPart = auth.LegacyAuthentication.makeAuthPart(testPairs[0], challengeText)
+    const authorization = `bearer ${authPart}`
+
+    const s = new Readable()
+    s.push('hello world')
+    s.push(null)
+
+    try {
+      await server.handleRequest(testAddrs[0], 'foo.txt',
+                                 { 'content-type' : 'text/text',
+                                   'content-length': 2 * 1024 * 1024,
+                                   'if-match': 'not-the-current-etag',
+                                   authorization }, s)
+    } catch (error) {
+      expect(error).toBeInstanceOf(errors.PayloadTooLargeError)
+    }
+    expect(statSpy).not.toHaveBeenCalled()
+    expect(proofSpy).not.toHaveBeenCalled()
+  })
+})
+
 test('auth token timeout cache monitoring', async () => {
   await usingMemoryDriver(async (mockDriver) => {
     const server = new HubServer(mockDriver, new MockProofs(), {
@@ -4,7 +4,7 @@ import * as path from 'path'
 import * as https from 'https'
 import * as tlsServer from '../../src/server/tlsServer.js'
 import { TlsPemCert, TlsPfxCert } from '../../src/server/config.js'
-import { AddressInfo } from 'net'
+import { AddressInfo, Socket } from 'net'
 import { RequestOptions } from 'https'
 import { IncomingMessage } from 'http'
 import { readStream } from '../../src/server/utils.js'
@@ -274,3 +274,49 @@ describe('test tls - encrypted pem files', () => {
     server.unref()
   })
 })
+
+describe('test tls - accepted sockets disable nagle', () => {
+  const certData: TlsPemCert = {
+    keyFile: keyPemUnencryptedBuffer.toString(),
+    certFile: keyCertBuffer.toString()
+  }
+
+  const app = express()
+  app.get('/', (req, res) => res.send('OKAY'))
+
+  const server = tlsServer.createHttpsServer(app, certData)
+
+  it('calls setNoDelay(true) on accepted sockets', async () => {
+    // Runs ahead of the server's own connection listener, so the spy is in
+    // place before disableNagle touches the socket.
+    const noDelaySpies: jest.SpyInstance[] = []
+    server.prependListener('connection', (socket: Socket) => {
+      noDelaySpies.push(jest.spyOn(socket, 'setNoDelay'))
+    })
+
+    await new Promise<void>((resolve, reject) => {
+      server.on('error', error => reject(error))
+      server.listen(0, '127.0.0.1', () => resolve())
+    })
+
+    const addr = server.address() as AddressInfo
+    const endpoint = `https://${addr.address}:${addr.port}`
+    const requestOpts: RequestOptions = {
+      rejectUnauthorized: false,
+    }
+
+    const res = await new Promise<IncomingMessage>((resolve, reject) => {
+      https.get(endpoint, requestOpts, res => resolve(res))
+        .on('error', error => reject(error))
+    })
+    await readStream(res)
+
+    expect(noDelaySpies.length).toBeGreaterThan(0)
+    noDelaySpies.forEach(spy => expect(spy).toHaveBeenCalledWith(true))
+  })
+
+  afterAll(() => {
+    server.close()
+    server.unref()
+  })
+})